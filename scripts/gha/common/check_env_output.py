@@ -3,17 +3,12 @@ from __future__ import annotations
 
 import argparse
 import os
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def _append_github_output(name: str, value: str) -> None:
-    github_output = os.environ.get("GITHUB_OUTPUT")
-    if not github_output:
-        print(f"{name}={value}")
-        return
-
-    with Path(github_output).open("a", encoding="utf-8") as f:
-        f.write(f"{name}={value}\n")
+from common.gh_output import GhOutput  # noqa: E402
 
 
 def main() -> int:
@@ -31,7 +26,8 @@ def main() -> int:
 
     raw_value = os.environ.get(args.env_var, "")
     present = bool(raw_value.strip())
-    _append_github_output(args.output_name, "true" if present else "false")
+    with GhOutput() as out:
+        out.write(args.output_name, "true" if present else "false")
 
     if not present and args.missing_message:
         print(args.missing_message)
@@ -2,7 +2,12 @@
 from __future__ import annotations
 
 import argparse
-import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from common.git import git  # noqa: E402
 
 
 def main() -> int:
@@ -14,8 +19,8 @@ def main() -> int:
     )
     args = parser.parse_args()
 
-    subprocess.run(["git", "config", "user.name", args.name], check=True)
-    subprocess.run(["git", "config", "user.email", args.email], check=True)
+    git("config", "user.name", args.name)
+    git("config", "user.email", args.email)
     return 0
 
 
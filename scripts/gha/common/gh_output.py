@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import TracebackType
+from typing import TextIO
+
+
+class GhOutput:
+    """Appends `name=value` step outputs to $GITHUB_OUTPUT through one buffered handle.
+
+    Falls back to printing the pairs when GITHUB_OUTPUT is not set (local runs).
+    """
+
+    def __init__(self) -> None:
+        self._path = os.environ.get("GITHUB_OUTPUT")
+        self._f: TextIO | None = None
+
+    def __enter__(self) -> GhOutput:
+        if self._path:
+            self._f = Path(self._path).open("a", encoding="utf-8", buffering=1 << 16)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+    def write(self, name: str, value: str) -> None:
+        if self._f is None:
+            print(f"{name}={value}")
+            return
+        self._f.write(f"{name}={value}\n")
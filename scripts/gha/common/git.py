@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import os
+import subprocess
+from typing import Any
+
+# No optional index/ref locking, no pager, and untranslated messages we can match on.
+GIT_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0", "GIT_PAGER": "cat", "LC_ALL": "C"}
+
+_NETWORK_COMMANDS = {"fetch", "ls-remote", "pull", "push"}
+
+
+def git(*args: str, check: bool = True, **kwargs: Any) -> subprocess.CompletedProcess[Any]:
+    """Runs `git <args>` with GIT_ENV; commands that talk to a remote use protocol v2."""
+    cmd = ["git", "--no-pager"]
+    if args and args[0] in _NETWORK_COMMANDS:
+        cmd += ["-c", "protocol.version=2"]
+    return subprocess.run([*cmd, *args], env=GIT_ENV, check=check, **kwargs)
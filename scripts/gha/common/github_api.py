@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import shutil
+import urllib.request
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+
+def token_from_env() -> str | None:
+    """Returns the token GitHub Actions exposes to the step (GITHUB_TOKEN, or GH_TOKEN for gh)."""
+    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN") or ""
+    return token.strip() or None
+
+
+class GitHubApi:
+    """Minimal GitHub REST client that keeps one HTTPS connection open across requests.
+
+    Callers fall back to the `gh` CLI when no token (or GITHUB_REPOSITORY) is available.
+    """
+
+    def __init__(self, token: str, host: str = "api.github.com") -> None:
+        self._conn = http.client.HTTPSConnection(host, timeout=30)
+        self._headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {token}",
+            "User-Agent": "ztnet-cli-release-scripts",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+
+    def __enter__(self) -> GitHubApi:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get(self, path: str) -> tuple[int, bytes]:
+        self._conn.request("GET", path, headers=self._headers)
+        resp = self._conn.getresponse()
+        # Drain the body so the connection can be reused for the next request.
+        return resp.status, resp.read()
+
+    def get_json(self, path: str) -> tuple[int, Any]:
+        status, body = self.get(path)
+        return status, json.loads(body) if status == 200 else None
+
+    def download(self, url: str, dest: Path) -> None:
+        # Release asset URLs redirect to a different host, which urllib follows for us.
+        req = urllib.request.Request(url, headers={"User-Agent": self._headers["User-Agent"]})
+        with urllib.request.urlopen(req) as resp, dest.open("wb") as f:  # noqa: S310
+            shutil.copyfileobj(resp, f)
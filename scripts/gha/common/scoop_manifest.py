@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+# Same bytes json.dumps(manifest, indent=2) produced, including the escaped em dash.
+_TEMPLATE = """\
+{{
+  "version": "{version}",
+  "description": "ZTNet CLI \\u2014 manage ZeroTier networks via ZTNet",
+  "homepage": "https://github.com/JKamsker/ztnet-cli",
+  "license": "AGPL-3.0-only",
+  "architecture": {{
+    "64bit": {{
+      "url": "https://github.com/JKamsker/ztnet-cli/releases/download/v{version}/ztnet-{version}-x86_64-pc-windows-msvc.zip",
+      "hash": "{hash}"
+    }}
+  }},
+  "bin": "ztnet.exe"
+}}
+"""
+
+
+def write_manifest(path: Path, version: str, hash_: str) -> None:
+    path.write_bytes(_TEMPLATE.format(version=version, hash=hash_).encode("utf-8"))
@@ -2,87 +2,71 @@
 from __future__ import annotations
 
 import argparse
-import json
+import functools
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+_PKG_VERSION_RE = re.compile(
+    rb'^(\[package\][ \t]*\r?\n(?:(?![ \t]*\[)[^\n]*\n)*?[ \t]*version[ \t]*=[ \t]*)"[^"]*"',
+    re.MULTILINE,
+)
+
+_NPM_VERSION_RE = re.compile(rb'("version"\s*:\s*)"[^"]*"')
+
+
+@functools.lru_cache(maxsize=None)
+def _cargo_lock_version_re(crate_name: str) -> re.Pattern[bytes]:
+    return re.compile(
+        rb'^(\[\[package\]\]\r?\n(?:[^\r\n]+\r?\n)*?[ \t]*name = "'
+        + re.escape(crate_name.encode())
+        + rb'"\r?\n(?:[^\r\n]+\r?\n)*?[ \t]*version = )"[^"]*"',
+        re.MULTILINE,
+    )
+
+
 def _update_cargo_toml_version(cargo_toml: Path, new_version: str) -> None:
-    lines = cargo_toml.read_text(encoding="utf-8").splitlines()
-
-    in_package = False
-    updated = False
-    for i, line in enumerate(lines):
-        if line.strip() == "[package]":
-            in_package = True
-            continue
-        if in_package and line.lstrip().startswith("[") and line.strip() != "[package]":
-            in_package = False
-        if not in_package:
-            continue
-
-        match = re.match(r"^(\s*)version\s*=", line)
-        if match:
-            indent = match.group(1)
-            lines[i] = f'{indent}version = "{new_version}"'
-            updated = True
-            break
-
-    if not updated:
+    buf = cargo_toml.read_bytes()
+    new, n = _PKG_VERSION_RE.subn(rb'\1"' + new_version.encode() + b'"', buf, count=1)
+    if n == 0:
         raise SystemExit("Could not update [package].version in Cargo.toml")
 
-    cargo_toml.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    if new != buf:
+        cargo_toml.write_bytes(new)
 
 
 def _update_cargo_lock_root_version(cargo_lock: Path, crate_name: str, new_version: str) -> None:
     if not cargo_lock.is_file():
         return
 
-    lines = cargo_lock.read_text(encoding="utf-8").splitlines()
-
-    in_package = False
-    is_target_package = False
-    updated = False
-
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if stripped == "[[package]]":
-            in_package = True
-            is_target_package = False
-            continue
-        if in_package and stripped == "":
-            in_package = False
-            is_target_package = False
-            continue
-        if not in_package:
-            continue
-
-        if stripped == f'name = "{crate_name}"':
-            is_target_package = True
-            continue
-
-        if is_target_package and stripped.startswith("version ="):
-            indent = line[: len(line) - len(line.lstrip(" "))]
-            lines[i] = f'{indent}version = "{new_version}"'
-            updated = True
-            break
-
-    if not updated:
+    buf = cargo_lock.read_bytes()
+    new, n = _cargo_lock_version_re(crate_name).subn(rb'\1"' + new_version.encode() + b'"', buf, count=1)
+    if n == 0:
         raise SystemExit(f"Could not find version for {crate_name} in Cargo.lock")
 
-    cargo_lock.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    if new != buf:
+        cargo_lock.write_bytes(new)
 
 
 def _update_npm_package_json_version(npm_package_json: Path, new_version: str) -> None:
     if not npm_package_json.is_file():
         return
 
-    data = json.loads(npm_package_json.read_text(encoding="utf-8"))
-    if not isinstance(data, dict):
-        raise SystemExit(f"Unsupported npm package.json format: {npm_package_json}")
+    buf = npm_package_json.read_bytes()
+    new, n = _NPM_VERSION_RE.subn(rb'\1"' + new_version.encode() + b'"', buf, count=1)
+    if n == 0:
+        # No "version" field to patch in place; fall back to a full rewrite.
+        import json
+
+        data = json.loads(buf)
+        if not isinstance(data, dict):
+            raise SystemExit(f"Unsupported npm package.json format: {npm_package_json}")
+        data["version"] = new_version
+        new = (json.dumps(data, indent=2) + "\n").encode("utf-8")
 
-    data["version"] = new_version
-    npm_package_json.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    if new != buf:
+        npm_package_json.write_bytes(new)
 
 
 def main() -> int:
@@ -94,9 +78,15 @@ def main() -> int:
     parser.add_argument("--npm-package-json", default="npm/package.json")
     args = parser.parse_args()
 
-    _update_cargo_toml_version(Path(args.cargo_toml), args.version)
-    _update_cargo_lock_root_version(Path(args.cargo_lock), args.crate_name, args.version)
-    _update_npm_package_json_version(Path(args.npm_package_json), args.version)
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        futures = [
+            ex.submit(_update_cargo_toml_version, Path(args.cargo_toml), args.version),
+            ex.submit(_update_cargo_lock_root_version, Path(args.cargo_lock), args.crate_name, args.version),
+            ex.submit(_update_npm_package_json_version, Path(args.npm_package_json), args.version),
+        ]
+        for future in futures:
+            # Re-raises SystemExit from a failed update so the job still fails.
+            future.result()
     return 0
 
 
@@ -2,18 +2,60 @@
 from __future__ import annotations
 
 import argparse
+import http.client
 import os
 import subprocess
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def _append_github_output(name: str, value: str) -> None:
-    github_output = os.environ.get("GITHUB_OUTPUT")
-    if not github_output:
-        print(f"{name}={value}")
-        return
-    with Path(github_output).open("a", encoding="utf-8") as f:
-        f.write(f"{name}={value}\n")
+from common.gh_output import GhOutput  # noqa: E402
+from common.git import git  # noqa: E402
+from common.github_api import GitHubApi, token_from_env  # noqa: E402
+
+
+def _remote_tag_missing(tag: str) -> bool:
+    # --exit-code makes ls-remote exit 2 when no ref matches.
+    result = git(
+        "ls-remote",
+        "--tags",
+        "--exit-code",
+        "origin",
+        f"refs/tags/{tag}",
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    return result.returncode == 2
+
+
+def _release_exists(tag: str) -> bool:
+    # A release cannot exist without its tag, so skip the API call when the tag is not on origin.
+    if _remote_tag_missing(tag):
+        return False
+
+    token = token_from_env()
+    repo = os.environ.get("GITHUB_REPOSITORY")
+    if not token or not repo:
+        result = subprocess.run(
+            ["gh", "release", "view", tag],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        return result.returncode == 0
+
+    try:
+        with GitHubApi(token) as api:
+            status, _ = api.get(f"/repos/{repo}/releases/tags/{tag}")
+    except (OSError, http.client.HTTPException) as e:
+        print(f"Failed to look up release {tag}: {e}", file=sys.stderr)
+        return False
+
+    if status not in (200, 404):
+        print(f"Unexpected HTTP {status} while looking up release {tag}", file=sys.stderr)
+    return status == 200
 
 
 def main() -> int:
@@ -23,17 +65,12 @@ def main() -> int:
     args = parser.parse_args()
 
     tag = f"v{args.version}"
-    result = subprocess.run(
-        ["gh", "release", "view", tag],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-        check=False,
-    )
+    exists = _release_exists(tag)
 
-    _append_github_output(args.output_name, "true" if result.returncode == 0 else "false")
+    with GhOutput() as out:
+        out.write(args.output_name, "true" if exists else "false")
     return 0
 
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
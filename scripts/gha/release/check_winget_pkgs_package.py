@@ -2,20 +2,14 @@
 from __future__ import annotations
 
 import argparse
-import os
 import sys
 import urllib.error
 import urllib.request
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def _append_github_output(name: str, value: str) -> None:
-    github_output = os.environ.get("GITHUB_OUTPUT")
-    if not github_output:
-        print(f"{name}={value}")
-        return
-    with Path(github_output).open("a", encoding="utf-8") as f:
-        f.write(f"{name}={value}\n")
+from common.gh_output import GhOutput  # noqa: E402
 
 
 def main() -> int:
@@ -27,30 +21,54 @@ def main() -> int:
         default="exists",
         help="Output key name.",
     )
+    parser.add_argument(
+        "--etag-file",
+        default=None,
+        help="File used to persist the response ETag for conditional requests (optional).",
+    )
     args = parser.parse_args()
 
+    etag_file = Path(args.etag_file) if args.etag_file else None
+
     url = (
         "https://api.github.com/repos/microsoft/winget-pkgs/contents/"
         "manifests/j/JKamsker/ZTNetCLI?ref=master"
     )
-    req = urllib.request.Request(url, headers={"Accept": "application/vnd.github+json"})
+    headers = {"Accept": "application/vnd.github+json"}
+    if etag_file is not None and etag_file.is_file():
+        cached_etag = etag_file.read_text(encoding="utf-8").strip()
+        if cached_etag:
+            headers["If-None-Match"] = cached_etag
+    req = urllib.request.Request(url, headers=headers)
 
+    etag = None
     try:
         with urllib.request.urlopen(req) as resp:  # noqa: S310
             status = getattr(resp, "status", 200)
+            etag = resp.headers.get("ETag")
     except urllib.error.HTTPError as e:
         status = e.code
     except Exception as e:  # pragma: no cover
         print(f"Failed to query winget-pkgs: {e}", file=sys.stderr)
-        _append_github_output(args.output_name, "false")
-        return 0
+        status = None
+
+    if etag_file is not None and status is not None:
+        # Only a 200 ETag is cached, so a later 304 means the package is still there.
+        if status == 200 and etag:
+            etag_file.parent.mkdir(parents=True, exist_ok=True)
+            etag_file.write_text(f"{etag}\n", encoding="utf-8")
+        elif status != 304:
+            etag_file.unlink(missing_ok=True)
+
+    if status == 304:
+        print("winget-pkgs package unchanged since last check (HTTP 304)")
 
-    if status == 200:
-        _append_github_output(args.output_name, "true")
-        return 0
+    exists = status in (200, 304)
+    if status is not None and not exists:
+        print(f"Package not in winget-pkgs yet (HTTP {status}); skipping")
 
-    print(f"Package not in winget-pkgs yet (HTTP {status}); skipping")
-    _append_github_output(args.output_name, "false")
+    with GhOutput() as out:
+        out.write(args.output_name, "true" if exists else "false")
     return 0
 
 
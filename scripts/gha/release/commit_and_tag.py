@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 import argparse
-import subprocess
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def _run(cmd: list[str]) -> None:
-    subprocess.run(cmd, check=True)
+from common.git import git  # noqa: E402
 
 
 def main() -> int:
@@ -22,17 +22,27 @@ def main() -> int:
     if Path("npm/package.json").is_file():
         paths.append("npm/package.json")
 
-    _run(["git", "add", *paths])
-
-    staged = subprocess.run(["git", "diff", "--cached", "--quiet"], check=False)
-    if staged.returncode == 0:
-        raise SystemExit("No staged changes; refusing to create release tag.")
-
-    _run(["git", "commit", "-m", f"chore(release): {tag}"])
-    _run(["git", "tag", "-a", tag, "-m", tag])
-
-    _run(["git", "push", "origin", args.branch])
-    _run(["git", "push", "origin", tag])
+    # Committing the paths directly stages them and fails when none of them changed.
+    commit = git(
+        "commit",
+        "-m",
+        f"chore(release): {tag}",
+        "--",
+        *paths,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if commit.returncode != 0:
+        output = commit.stdout + commit.stderr
+        if "nothing to commit" in output or "nothing added to commit" in output:
+            raise SystemExit("No changes to commit; refusing to create release tag.")
+        sys.stderr.write(output)
+        raise SystemExit(commit.returncode)
+    print(commit.stdout, end="")
+
+    git("tag", "-a", tag, "-m", tag)
+    git("push", "--atomic", "origin", args.branch, tag)
     return 0
 
 
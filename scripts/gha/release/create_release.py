@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import subprocess
 from pathlib import Path
 
@@ -14,7 +15,11 @@ def main() -> int:
 
     tag = f"v{args.version}"
     dist_dir = Path(args.dist_dir)
-    assets = sorted(p for p in dist_dir.glob("*") if p.is_file())
+    with os.scandir(dist_dir) as it:
+        assets = sorted(
+            (dist_dir / e.name for e in it if e.is_file(follow_symlinks=False)),
+            key=lambda p: p.name,
+        )
     if not assets:
         raise SystemExit(f"No assets found in {dist_dir}")
 
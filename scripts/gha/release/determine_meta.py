@@ -3,19 +3,18 @@ from __future__ import annotations
 
 import os
 import re
-import subprocess
+import sys
 from pathlib import Path
 
-import tomllib
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+from common.gh_output import GhOutput  # noqa: E402
+from common.git import git  # noqa: E402
 
-def _append_github_output(name: str, value: str) -> None:
-    github_output = os.environ.get("GITHUB_OUTPUT")
-    if not github_output:
-        print(f"{name}={value}")
-        return
-    with Path(github_output).open("a", encoding="utf-8") as f:
-        f.write(f"{name}={value}\n")
+_VER_RE = re.compile(
+    rb'^\[package\][ \t]*\r?\n(?:(?![ \t]*\[)[^\n]*\n)*?[ \t]*version[ \t]*=[ \t]*"(\d+)\.(\d+)\.(\d+)"',
+    re.MULTILINE,
+)
 
 
 def main() -> int:
@@ -29,35 +28,26 @@ def main() -> int:
     else:
         mode = "auto"
 
-        data = tomllib.loads(Path("Cargo.toml").read_text(encoding="utf-8"))
-        current = data["package"]["version"]
-
-        match = re.fullmatch(r"(\d+)\.(\d+)\.(\d+)", current)
+        match = _VER_RE.search(Path("Cargo.toml").read_bytes())
         if not match:
-            raise SystemExit(f"Unsupported version format: {current!r}")
+            raise SystemExit("Could not read a MAJOR.MINOR.PATCH [package].version from Cargo.toml")
 
         major, minor, patch = map(int, match.groups())
-        while True:
+        tags = set(git("tag", "--list", "v*", capture_output=True, text=True).stdout.split())
+
+        patch += 1
+        while f"v{major}.{minor}.{patch}" in tags:
             patch += 1
-            candidate = f"{major}.{minor}.{patch}"
-            candidate_tag = f"v{candidate}"
-            result = subprocess.run(
-                ["git", "rev-parse", "-q", "--verify", f"refs/tags/{candidate_tag}"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=False,
-            )
-            if result.returncode != 0:
-                version = candidate
-                tag_out = candidate_tag
-                break
+        version = f"{major}.{minor}.{patch}"
+        tag_out = f"v{version}"
 
     if not version:
         raise SystemExit("Failed to determine version")
 
-    _append_github_output("mode", mode)
-    _append_github_output("version", version)
-    _append_github_output("tag", tag_out)
+    with GhOutput() as out:
+        out.write("mode", mode)
+        out.write("version", version)
+        out.write("tag", tag_out)
     return 0
 
 
@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import argparse
 import hashlib
+import io
 import os
 import subprocess
 import shutil
-import tarfile
-import zipfile
 from pathlib import Path
+from typing import BinaryIO
 
 
 def _detect_rust_host() -> str:
@@ -25,9 +25,64 @@ def _detect_rust_host() -> str:
 
 
 def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    h.update(path.read_bytes())
-    return h.hexdigest()
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class _HashingWriter(io.RawIOBase):
+    """Forwards writes to `f` while feeding the same bytes into a SHA-256 digest."""
+
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+        self.sha256 = hashlib.sha256()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: bytes) -> int:  # type: ignore[override]
+        self.sha256.update(b)
+        return self._f.write(b)
+
+
+def _write_zip(src: Path, arcname: str, asset_path: Path) -> str:
+    import zipfile
+
+    # The hashing writer is not seekable, so zipfile streams entries with data descriptors.
+    with asset_path.open("wb") as raw:
+        hw = _HashingWriter(raw)
+        with zipfile.ZipFile(hw, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as z:
+            z.write(src, arcname=arcname)
+    return hw.sha256.hexdigest()
+
+
+def _write_tar_gz(src: Path, arcname: str, asset_path: Path) -> str:
+    # Imported here: tarfile pulls in the compression modules and Windows runners only build zips.
+    import gzip
+    import tarfile
+
+    pigz = shutil.which("pigz")
+    with asset_path.open("wb") as raw:
+        hw = _HashingWriter(raw)
+        if pigz:
+            # pigz deflates on all cores; its stdout is streamed through the hashing writer.
+            tar_path = asset_path.with_suffix("")
+            with tarfile.open(tar_path, mode="w") as t:
+                t.add(src, arcname=arcname)
+            try:
+                with subprocess.Popen([pigz, "-6", "-c", str(tar_path)], stdout=subprocess.PIPE) as proc:
+                    shutil.copyfileobj(proc.stdout, hw, 1 << 20)
+                if proc.returncode != 0:
+                    raise SystemExit(f"pigz failed with exit code {proc.returncode}")
+            finally:
+                tar_path.unlink(missing_ok=True)
+            return hw.sha256.hexdigest()
+
+        with (
+            gzip.GzipFile(filename=asset_path.name, fileobj=hw, mode="wb", compresslevel=6) as gz,
+            tarfile.open(fileobj=gz, mode="w|", bufsize=1 << 20) as t,
+        ):
+            t.add(src, arcname=arcname)
+    return hw.sha256.hexdigest()
 
 
 def main() -> int:
@@ -36,6 +91,11 @@ def main() -> int:
     parser.add_argument("--bin-name", default="ztnet")
     parser.add_argument("--dist-dir", default="dist")
     parser.add_argument("--release-dir", default="target/release")
+    parser.add_argument(
+        "--cache-dir",
+        default=".cache",
+        help="Where source binary hashes are recorded so unchanged binaries are not re-archived.",
+    )
     args = parser.parse_args()
 
     runner_os = (os.environ.get("RUNNER_OS") or "").lower()
@@ -53,23 +113,36 @@ def main() -> int:
     dst_binary = dist_dir / binary_name
     shutil.copy2(src_binary, dst_binary)
 
+    ext = "zip" if is_windows else "tar.gz"
+    asset_name = f"{args.bin_name}-{args.version}-{target}.{ext}"
+    asset_path = dist_dir / asset_name
+    sha_path = dist_dir / f"{asset_name}.sha256"
+
+    # Keyed by asset name (which includes the version) so a reused archive always matches its name.
+    cache_file = Path(args.cache_dir) / f"{asset_name}.src.sha256"
+    src_sha = _sha256_file(src_binary)
+    if (
+        asset_path.is_file()
+        and sha_path.is_file()
+        and cache_file.is_file()
+        and cache_file.read_text(encoding="utf-8").strip() == src_sha
+    ):
+        print(f"{src_binary} unchanged; reusing {asset_path}")
+        return 0
+
     if is_windows:
-        asset_name = f"{args.bin_name}-{args.version}-{target}.zip"
-        asset_path = dist_dir / asset_name
-        with zipfile.ZipFile(asset_path, mode="w", compression=zipfile.ZIP_DEFLATED) as z:
-            z.write(dst_binary, arcname=binary_name)
+        sha = _write_zip(dst_binary, binary_name, asset_path)
     else:
-        asset_name = f"{args.bin_name}-{args.version}-{target}.tar.gz"
-        asset_path = dist_dir / asset_name
-        with tarfile.open(asset_path, mode="w:gz") as t:
-            t.add(dst_binary, arcname=binary_name)
+        sha = _write_tar_gz(dst_binary, binary_name, asset_path)
 
-    sha = _sha256_file(asset_path)
-    (dist_dir / f"{asset_name}.sha256").write_text(
+    sha_path.write_text(
         f"{sha}  {asset_name}\n",
         encoding="utf-8",
     )
 
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(f"{src_sha}\n", encoding="utf-8")
+
     return 0
 
 
@@ -1,25 +1,27 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import os
+import re
+import sys
 from pathlib import Path
 
-import tomllib
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+from common.gh_output import GhOutput  # noqa: E402
 
-def _append_github_output(name: str, value: str) -> None:
-    github_output = os.environ.get("GITHUB_OUTPUT")
-    if not github_output:
-        print(f"{name}={value}")
-        return
-    with Path(github_output).open("a", encoding="utf-8") as f:
-        f.write(f"{name}={value}\n")
+_VER_RE = re.compile(
+    rb'^\[package\][ \t]*\r?\n(?:(?![ \t]*\[)[^\n]*\n)*?[ \t]*version[ \t]*=[ \t]*"([^"]+)"',
+    re.MULTILINE,
+)
 
 
 def main() -> int:
-    data = tomllib.loads(Path("Cargo.toml").read_text(encoding="utf-8"))
-    version = data["package"]["version"]
-    _append_github_output("version", version)
+    match = _VER_RE.search(Path("Cargo.toml").read_bytes())
+    if not match:
+        raise SystemExit("Could not read [package].version from Cargo.toml")
+    version = match.group(1).decode("utf-8")
+    with GhOutput() as out:
+        out.write("version", version)
     return 0
 
 
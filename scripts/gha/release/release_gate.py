@@ -3,21 +3,22 @@ from __future__ import annotations
 
 import os
 import subprocess
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def _append_github_output(name: str, value: str) -> None:
-    github_output = os.environ.get("GITHUB_OUTPUT")
-    if not github_output:
-        print(f"{name}={value}")
-        return
-    with Path(github_output).open("a", encoding="utf-8") as f:
-        f.write(f"{name}={value}\n")
+from common.gh_output import GhOutput  # noqa: E402
+from common.git import git  # noqa: E402
 
 
 def _latest_release_tag() -> str | None:
-    result = subprocess.run(
-        ["git", "describe", "--tags", "--match", "v*", "--abbrev=0"],
+    result = git(
+        "describe",
+        "--tags",
+        "--match",
+        "v*",
+        "--abbrev=0",
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
@@ -31,14 +32,11 @@ def _latest_release_tag() -> str | None:
 
 
 def _has_src_diff_since(tag: str) -> bool:
-    result = subprocess.run(
-        ["git", "diff", "--name-only", f"{tag}..HEAD", "--", "src"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        check=True,
-    )
-    return bool(result.stdout.strip())
+    # --quiet exits 1 on the first difference without listing file names.
+    result = git("diff", "--quiet", f"{tag}..HEAD", "--", "src", check=False)
+    if result.returncode not in (0, 1):
+        raise SystemExit(f"git diff against {tag} failed with exit code {result.returncode}")
+    return result.returncode == 1
 
 
 def main() -> int:
@@ -67,9 +65,10 @@ def main() -> int:
                 should_run = "false"
                 reason = "no_src_changes"
 
-    _append_github_output("should_run", should_run)
-    _append_github_output("reason", reason)
-    _append_github_output("base_tag", base_tag)
+    with GhOutput() as out:
+        out.write("should_run", should_run)
+        out.write("reason", reason)
+        out.write("base_tag", base_tag)
     return 0
 
 
@@ -2,13 +2,34 @@
 from __future__ import annotations
 
 import argparse
-import shutil
+import fnmatch
+import os
+import re
+import sys
 from pathlib import Path
 
 
 def _copy(src: Path, dest_dir: Path) -> None:
     dest_dir.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dest_dir / src.name)
+    dest = dest_dir / src.name
+
+    with src.open("rb") as fsrc, dest.open("wb") as fdst:
+        st = os.fstat(fsrc.fileno())
+        if sys.platform.startswith("linux"):
+            # In-kernel copy; no user-space buffer.
+            offset = 0
+            while offset < st.st_size:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, st.st_size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        else:
+            import shutil
+
+            shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+
+    # Preserve timestamps like shutil.copy2 did.
+    os.utime(dest, ns=(st.st_atime_ns, st.st_mtime_ns))
 
 
 def main() -> int:
@@ -31,6 +52,8 @@ def main() -> int:
 
     artifacts_dir = npm_dir / "artifacts"
     if artifacts_dir.exists():
+        import shutil
+
         shutil.rmtree(artifacts_dir)
     artifacts_dir.mkdir(parents=True, exist_ok=True)
 
@@ -38,9 +61,12 @@ def main() -> int:
         f"{args.bin_name}-{args.version}-*.zip",
         f"{args.bin_name}-{args.version}-*.tar.gz",
     ]
-    archives: list[Path] = []
-    for pattern in patterns:
-        archives.extend(sorted(dist_dir.glob(pattern)))
+    archive_re = re.compile("|".join(fnmatch.translate(p) for p in patterns))
+    with os.scandir(dist_dir) as it:
+        archives = sorted(
+            (dist_dir / e.name for e in it if archive_re.match(e.name) and e.is_file()),
+            key=lambda p: p.name,
+        )
 
     if not archives:
         raise SystemExit(f"No archives found in {dist_dir} for version {args.version}")
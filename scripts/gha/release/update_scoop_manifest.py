@@ -2,10 +2,14 @@
 from __future__ import annotations
 
 import argparse
-import json
 import shutil
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from common.scoop_manifest import write_manifest  # noqa: E402
+
 
 def _parse_sha256_from_file(sha_file: Path) -> str:
     line = sha_file.read_text(encoding="utf-8").strip()
@@ -28,24 +32,7 @@ def main() -> int:
 
     hash_ = _parse_sha256_from_file(sha_file)
 
-    manifest = {
-        "version": args.version,
-        "description": "ZTNet CLI — manage ZeroTier networks via ZTNet",
-        "homepage": "https://github.com/JKamsker/ztnet-cli",
-        "license": "AGPL-3.0-only",
-        "architecture": {
-            "64bit": {
-                "url": (
-                    f"https://github.com/JKamsker/ztnet-cli/releases/download/"
-                    f"v{args.version}/ztnet-{args.version}-x86_64-pc-windows-msvc.zip"
-                ),
-                "hash": hash_,
-            }
-        },
-        "bin": "ztnet.exe",
-    }
-
-    Path(args.manifest).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    write_manifest(Path(args.manifest), args.version, hash_)
 
     if args.cleanup_dir:
         shutil.rmtree(args.cleanup_dir, ignore_errors=True)
@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 import argparse
-import subprocess
+import sys
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def _run(cmd: list[str]) -> None:
-    subprocess.run(cmd, check=True)
+from common.git import git  # noqa: E402
 
 
 def main() -> int:
@@ -15,17 +16,28 @@ def main() -> int:
     parser.add_argument("--branch", default="master")
     args = parser.parse_args()
 
-    diff = subprocess.run(["git", "diff", "--quiet"], check=False)
-    if diff.returncode == 0:
-        print("No changes to commit")
-        return 0
-
-    _run(["git", "add", "bucket/ztnet.json"])
-    _run(["git", "commit", "-m", f"chore(scoop): update manifest for {args.tag}"])
-    _run(["git", "push", "origin", args.branch])
+    commit = git(
+        "commit",
+        "-m",
+        f"chore(scoop): update manifest for {args.tag}",
+        "--",
+        "bucket/ztnet.json",
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if commit.returncode != 0:
+        output = commit.stdout + commit.stderr
+        if "nothing to commit" in output or "nothing added to commit" in output:
+            print("No changes to commit")
+            return 0
+        sys.stderr.write(output)
+        raise SystemExit(commit.returncode)
+    print(commit.stdout, end="")
+
+    git("push", "origin", args.branch)
     return 0
 
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
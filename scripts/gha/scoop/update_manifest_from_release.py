@@ -2,11 +2,17 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import shutil
 import subprocess
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from common.github_api import GitHubApi, token_from_env  # noqa: E402
+from common.scoop_manifest import write_manifest  # noqa: E402
+
 
 def _parse_sha256_from_file(sha_file: Path) -> str:
     line = sha_file.read_text(encoding="utf-8").strip()
@@ -15,6 +21,31 @@ def _parse_sha256_from_file(sha_file: Path) -> str:
     return line.split()[0]
 
 
+def _download_release_asset(tag: str, asset_name: str, dest_dir: Path) -> None:
+    token = token_from_env()
+    repo = os.environ.get("GITHUB_REPOSITORY")
+    if not token or not repo:
+        subprocess.run(
+            ["gh", "release", "download", tag, "-p", asset_name, "-D", str(dest_dir)],
+            check=True,
+        )
+        return
+
+    with GitHubApi(token) as api:
+        status, release = api.get_json(f"/repos/{repo}/releases/tags/{tag}")
+        if status != 200:
+            raise SystemExit(f"Failed to look up release {tag} (HTTP {status})")
+
+        url = next(
+            (a["browser_download_url"] for a in release.get("assets", []) if a.get("name") == asset_name),
+            None,
+        )
+        if url is None:
+            raise SystemExit(f"Release {tag} has no asset named {asset_name}")
+
+        api.download(url, dest_dir / asset_name)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Download SHA256 from a GitHub release and update bucket/ztnet.json.",
@@ -30,35 +61,15 @@ def main() -> int:
     tmp_dir.mkdir(parents=True, exist_ok=True)
 
     sha_name = f"ztnet-{version}-x86_64-pc-windows-msvc.zip.sha256"
-    subprocess.run(
-        ["gh", "release", "download", args.tag, "-p", sha_name, "-D", str(tmp_dir)],
-        check=True,
-    )
-
     sha_file = tmp_dir / sha_name
+    _download_release_asset(args.tag, sha_name, tmp_dir)
+
     if not sha_file.is_file():
         raise SystemExit(f"Expected {sha_name} not found in {tmp_dir}")
 
     hash_ = _parse_sha256_from_file(sha_file)
 
-    manifest = {
-        "version": version,
-        "description": "ZTNet CLI — manage ZeroTier networks via ZTNet",
-        "homepage": "https://github.com/JKamsker/ztnet-cli",
-        "license": "AGPL-3.0-only",
-        "architecture": {
-            "64bit": {
-                "url": (
-                    f"https://github.com/JKamsker/ztnet-cli/releases/download/"
-                    f"v{version}/ztnet-{version}-x86_64-pc-windows-msvc.zip"
-                ),
-                "hash": hash_,
-            }
-        },
-        "bin": "ztnet.exe",
-    }
-
-    Path(args.manifest).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    write_manifest(Path(args.manifest), version, hash_)
 
     shutil.rmtree(tmp_dir, ignore_errors=True)
     return 0